@@ -1,5 +1,5 @@
 from .config import Config
-from .karton import Consumer, Karton, LogConsumer, Producer
+from .karton import AsyncConsumer, AsyncKarton, Consumer, Karton, LogConsumer, Producer
 from .resource import LocalResource, RemoteResource, Resource
 from .task import Task
 
@@ -7,6 +7,8 @@ __all__ = [
     "Karton",
     "Producer",
     "Consumer",
+    "AsyncConsumer",
+    "AsyncKarton",
     "Task",
     "LogConsumer",
     "Config",
@@ -1,14 +1,28 @@
 import dataclasses
 import enum
+import functools
 import json
 import logging
 import time
 import urllib.parse
 import warnings
 from collections import defaultdict, namedtuple
-from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple, Union
+from typing import (
+    IO,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+    cast,
+)
 
 import boto3
+import orjson
 from botocore.credentials import (
     ContainerProvider,
     InstanceMetadataFetcher,
@@ -16,13 +30,17 @@ from botocore.credentials import (
 )
 from botocore.session import get_session
 from redis import AuthenticationError, StrictRedis
+from redis.asyncio import StrictRedis as AsyncStrictRedis
+from redis.asyncio.client import Pipeline as AsyncPipeline
 from redis.client import Pipeline
+from redis.commands.core import Script
+from redis.exceptions import NoScriptError
 from urllib3.response import HTTPResponse
 
 from .config import Config
 from .exceptions import InvalidIdentityError
 from .task import Task, TaskPriority, TaskState
-from .utils import chunks, chunks_iter
+from .utils import chunks, chunks_iter, json_dumps, json_loads
 
 KARTON_TASKS_QUEUE = "karton.tasks"
 KARTON_OPERATIONS_QUEUE = "karton.operations"
@@ -31,6 +49,38 @@ KARTON_BINDS_HSET = "karton.binds"
 KARTON_TASK_NAMESPACE = "karton.task"
 KARTON_OUTPUTS_NAMESPACE = "karton.outputs"
 
+# Methods adding commands to the pipeline can be used with asyncio pipelines too
+AnyPipeline = Union[Pipeline, AsyncPipeline]
+
+# Routed task queue name prefixes resolved once instead of on each routed task
+KARTON_QUEUE_PREFIXES = {
+    priority: f"karton.queue.{priority.value}" for priority in TaskPriority
+}
+
+# Gets bind of the consumer and pops up to ARGV[2] tasks from its queues
+# (ordered from the most to the least prioritized) along with their bodies.
+# KEYS: binds hash, consumer queues
+# ARGV: consumer identity, maximum number of tasks, task namespace
+# Task body keys are not known in advance, so they're built by the script and
+# not declared in KEYS. It works with a single Redis instance, but not with
+# Redis Cluster or proxies routing commands by declared keys.
+CONSUME_ROUTED_TASKS_SCRIPT = """
+local bind = redis.call('HGET', KEYS[1], ARGV[1])
+local bodies = {}
+local remaining = tonumber(ARGV[2])
+for i = 2, #KEYS do
+    while remaining > 0 do
+        local task_uid = redis.call('LPOP', KEYS[i])
+        if not task_uid then
+            break
+        end
+        table.insert(bodies, redis.call('GET', ARGV[3] .. ':' .. task_uid))
+        remaining = remaining - 1
+    end
+end
+return {bind, bodies}
+"""
+
 KartonBind = namedtuple(
     "KartonBind",
     ["identity", "info", "version", "persistent", "filters", "service_version"],
@@ -180,25 +230,20 @@ class KartonBackend:
             )
 
     @staticmethod
-    def make_redis(
+    def _get_redis_args(
         config,
         identity: Optional[str] = None,
         service_info: Optional[KartonServiceInfo] = None,
-    ) -> StrictRedis:
+    ) -> Dict[str, Any]:
         """
-        Create and test a Redis connection.
-
-        :param config: The karton configuration
-        :param identity: Karton service identity
-        :param service_info: Additional service identity metadata
-        :return: Redis connection
+        Get Redis connection arguments from the karton configuration
         """
         if service_info is not None:
             client_name: Optional[str] = service_info.make_client_name()
         else:
             client_name = identity
 
-        redis_args = {
+        return {
             "host": config["redis"]["host"],
             "port": config.getint("redis", "port", 6379),
             "db": config.getint("redis", "db", 0),
@@ -209,6 +254,24 @@ class KartonBackend:
             "socket_timeout": config.getint("redis", "socket_timeout", 30) or None,
             "decode_responses": True,
         }
+
+    @staticmethod
+    def make_redis(
+        config,
+        identity: Optional[str] = None,
+        service_info: Optional[KartonServiceInfo] = None,
+    ) -> StrictRedis:
+        """
+        Create and test a Redis connection.
+
+        :param config: The karton configuration
+        :param identity: Karton service identity
+        :param service_info: Additional service identity metadata
+        :return: Redis connection
+        """
+        redis_args = KartonBackend._get_redis_args(
+            config, identity=identity, service_info=service_info
+        )
         try:
             redis = StrictRedis(**redis_args)
             redis.ping()
@@ -221,6 +284,38 @@ class KartonBackend:
             redis.ping()
         return redis
 
+    @staticmethod
+    async def make_async_redis(
+        config,
+        identity: Optional[str] = None,
+        service_info: Optional[KartonServiceInfo] = None,
+        max_connections: Optional[int] = None,
+    ) -> AsyncStrictRedis:
+        """
+        Create and test an asyncio Redis connection pool.
+
+        It must be called within the event loop that is going to use it.
+
+        :param config: The karton configuration
+        :param identity: Karton service identity
+        :param service_info: Additional service identity metadata
+        :param max_connections: Maximum number of connections in pool
+        :return: Redis connection
+        """
+        redis_args = KartonBackend._get_redis_args(
+            config, identity=identity, service_info=service_info
+        )
+        redis_args["max_connections"] = max_connections
+        try:
+            redis = AsyncStrictRedis(**redis_args)
+            await redis.ping()
+        except AuthenticationError:
+            # See make_redis
+            del redis_args["password"]
+            redis = AsyncStrictRedis(**redis_args)
+            await redis.ping()
+        return redis
+
     @property
     def default_bucket_name(self) -> str:
         bucket_name = self.config.get("s3", "bucket")
@@ -237,7 +332,7 @@ class KartonBackend:
         :param priority: Queue priority (TaskPriority enum value)
         :return: Queue name
         """
-        return f"karton.queue.{priority.value}:{identity}"
+        return f"{KARTON_QUEUE_PREFIXES[priority]}:{identity}"
 
     @staticmethod
     def get_queue_names(identity: str) -> List[str]:
@@ -255,6 +350,15 @@ class KartonBackend:
             KartonBackend.get_queue_name(identity, TaskPriority.LOW),
         ]
 
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def _get_consumer_keys(identity: str) -> Tuple[str, ...]:
+        """
+        Return keys used on every iteration of consumer loop: binds hash
+        followed by routed task queue names. Cached to not rebuild them each time.
+        """
+        return (KARTON_BINDS_HSET, *KartonBackend.get_queue_names(identity))
+
     @staticmethod
     def serialize_bind(bind: KartonBind) -> str:
         """
@@ -263,7 +367,7 @@ class KartonBackend:
         :param bind: KartonBind object with bind definition
         :return: Serialized bind data
         """
-        return json.dumps(
+        return orjson.dumps(
             {
                 "info": bind.info,
                 "version": bind.version,
@@ -271,8 +375,8 @@ class KartonBackend:
                 "persistent": bind.persistent,
                 "service_version": bind.service_version,
             },
-            sort_keys=True,
-        )
+            option=orjson.OPT_SORT_KEYS,
+        ).decode("utf8")
 
     @staticmethod
     def unserialize_bind(identity: str, bind_data: str) -> KartonBind:
@@ -284,7 +388,7 @@ class KartonBackend:
         :param bind_data: Serialized bind data
         :return: KartonBind object with bind definition
         """
-        bind = json.loads(bind_data)
+        bind = orjson.loads(bind_data)
         if isinstance(bind, list):
             # Backwards compatibility (v2.x.x)
             return KartonBind(
@@ -304,6 +408,13 @@ class KartonBackend:
             service_version=bind.get("service_version"),
         )
 
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _unserialize_bind_cached(identity: str, bind_data: str) -> KartonBind:
+        # Consumer gets its bind on every loop iteration, but it rarely changes,
+        # so the serialized data is usually only hashed and compared
+        return KartonBackend.unserialize_bind(identity, bind_data)
+
     @staticmethod
     def unserialize_output(identity: str, output_data: Set[str]) -> KartonOutputs:
         """
@@ -416,17 +527,22 @@ class KartonBackend:
                     continue
         return bound_services
 
-    def get_task(self, task_uid: str) -> Optional[Task]:
+    def get_task(self, task_uid: str, parse_resources: bool = True) -> Optional[Task]:
         """
         Get task object with given identifier
 
         :param task_uid: Task identifier
+        :param parse_resources: If set to False, resources are not parsed.
+            It speeds up deserialization. Read :py:meth:`Task.unserialize`
+            documentation to learn more.
         :return: Task object
         """
         task_data = self.redis.get(f"{KARTON_TASK_NAMESPACE}:{task_uid}")
         if not task_data:
             return None
-        return Task.unserialize(task_data, backend=self)
+        return Task.unserialize(
+            task_data, backend=self, parse_resources=parse_resources
+        )
 
     def get_tasks(
         self,
@@ -584,7 +700,7 @@ class KartonBackend:
             task_keys, chunk_size=chunk_size, parse_resources=parse_resources
         )
 
-    def register_task(self, task: Task, pipe: Optional[Pipeline] = None) -> None:
+    def register_task(self, task: Task, pipe: Optional[AnyPipeline] = None) -> None:
         """
         Register or update task in Redis.
 
@@ -609,7 +725,7 @@ class KartonBackend:
         self.redis.mset(taskmap)
 
     def set_task_status(
-        self, task: Task, status: TaskState, pipe: Optional[Pipeline] = None
+        self, task: Task, status: TaskState, pipe: Optional[AnyPipeline] = None
     ) -> None:
         """
         Request task status change to be applied by karton-system
@@ -692,15 +808,19 @@ class KartonBackend:
         pipe.delete(queue)
         return self.get_tasks(pipe.execute()[0])
 
-    def produce_unrouted_task(self, task: Task) -> None:
+    def produce_unrouted_task(
+        self, task: Task, pipe: Optional[Pipeline] = None
+    ) -> None:
         """
         Add given task to unrouted task (``karton.tasks``) queue
 
         Task must be registered before with :py:meth:`register_task`
 
         :param task: Task object
+        :param pipe: Optional pipeline object if operation is a part of pipeline
         """
-        self.redis.rpush(KARTON_TASKS_QUEUE, task.uid)
+        rs = pipe or self.redis
+        rs.rpush(KARTON_TASKS_QUEUE, task.uid)
 
     def produce_routed_task(
         self, identity: str, task: Task, pipe: Optional[Pipeline] = None
@@ -775,6 +895,130 @@ class KartonBackend:
         queue, data = item
         return self.get_task(data)
 
+    @functools.cached_property
+    def _consume_routed_tasks_script(self) -> Script:
+        return self.redis.register_script(CONSUME_ROUTED_TASKS_SCRIPT)
+
+    def consume_routed_tasks(
+        self,
+        identity: str,
+        max_count: int = 1,
+        timeout: int = 5,
+        parse_resources: bool = True,
+    ) -> Tuple[Optional[KartonBind], List[Task]]:
+        """
+        Get current bind and a batch of routed tasks for given consumer identity.
+
+        Bind and queued tasks are fetched atomically in a single round-trip, so
+        consumer can check whether it's still up to date without an additional
+        request. If there are no tasks, blocks until new one appears or timeout
+        is reached.
+
+        :param identity: Karton service identity
+        :param max_count: Maximum number of tasks to get (default: 1)
+        :param timeout: Waiting for task timeout (default: 5)
+        :param parse_resources: If set to False, resources are not parsed.
+            Consumer uses it to defer resource deserialization until it checks
+            that task still matches its binds. Read :py:meth:`Task.unserialize`
+            documentation to learn more.
+        :return: Tuple of KartonBind object (or None if bind is not registered)
+            and list of Task objects
+        """
+        keys = self._get_consumer_keys(identity)
+        bind_data, task_bodies = self._consume_routed_tasks_script(
+            keys=keys,
+            args=[identity, max_count, KARTON_TASK_NAMESPACE],
+        )
+        bind = self._unserialize_bind_cached(identity, bind_data) if bind_data else None
+        if task_bodies:
+            return bind, self._unserialize_tasks(task_bodies, parse_resources)
+
+        # Queues are empty, so let's wait for a new task
+        item = self.consume_queues(self.get_queue_names(identity), timeout=timeout)
+        if not item:
+            return bind, []
+        queue, data = item
+        task = self.get_task(data, parse_resources=parse_resources)
+        return bind, [task] if task else []
+
+    async def consume_routed_tasks_async(
+        self,
+        redis: AsyncStrictRedis,
+        identity: str,
+        max_count: int = 1,
+        timeout: int = 5,
+        parse_resources: bool = True,
+    ) -> Tuple[Optional[KartonBind], List[Task]]:
+        """
+        Asyncio variant of :py:meth:`consume_routed_tasks` using
+        the provided asyncio Redis connection.
+
+        :param redis: Redis connection made by :py:meth:`make_async_redis`
+        :param identity: Karton service identity
+        :param max_count: Maximum number of tasks to get (default: 1)
+        :param timeout: Waiting for task timeout (default: 5)
+        :param parse_resources: If set to False, resources are not parsed.
+        :return: Tuple of KartonBind object (or None if bind is not registered)
+            and list of Task objects
+        """
+        keys = self._get_consumer_keys(identity)
+        args = (identity, max_count, KARTON_TASK_NAMESPACE)
+        script = self._consume_routed_tasks_script
+        try:
+            bind_data, task_bodies = await redis.evalsha(
+                script.sha, len(keys), *keys, *args
+            )
+        except NoScriptError:
+            bind_data, task_bodies = await redis.eval(
+                CONSUME_ROUTED_TASKS_SCRIPT, len(keys), *keys, *args
+            )
+        bind = self._unserialize_bind_cached(identity, bind_data) if bind_data else None
+        if task_bodies:
+            return bind, self._unserialize_tasks(task_bodies, parse_resources)
+
+        # Queues are empty, so let's wait for a new task
+        item = await redis.blpop(keys[1:], timeout=timeout)
+        if not item:
+            return bind, []
+        # Responses are decoded by the client
+        queue, data = cast(Tuple[str, str], item)
+        task_data = cast(
+            Optional[str], await redis.get(f"{KARTON_TASK_NAMESPACE}:{data}")
+        )
+        return bind, self._unserialize_tasks([task_data], parse_resources)
+
+    def _unserialize_tasks(
+        self, task_bodies: List[Optional[str]], parse_resources: bool
+    ) -> List[Task]:
+        """
+        Unserialize task bodies skipping the missing ones
+        """
+        return [
+            Task.unserialize(task_data, backend=self, parse_resources=parse_resources)
+            for task_data in task_bodies
+            if task_data is not None
+        ]
+
+    def restore_routed_tasks(
+        self, identity: str, tasks: List[Task], pipe: Optional[AnyPipeline] = None
+    ) -> None:
+        """
+        Put consumed tasks back at the front of routed task queues of given identity.
+
+        Used by consumer to give back prefetched tasks that won't be processed.
+
+        :param identity: Karton service identity
+        :param tasks: List of Task objects in the order they were consumed
+        :param pipe: Optional pipeline object if operation is a part of pipeline
+        """
+        if not tasks:
+            return
+        p = pipe or self.make_pipeline()
+        for task in reversed(tasks):
+            p.lpush(self.get_queue_name(identity, task.priority), task.uid)
+        if pipe is None:
+            p.execute()
+
     def restart_task(self, task: Task) -> Task:
         """
         Requeues consumed task back to the consumer queue.
@@ -820,7 +1064,7 @@ class KartonBackend:
         """
         return (
             self.redis.publish(
-                self._log_channel(logger_name, level), json.dumps(log_record)
+                self._log_channel(logger_name, level), json_dumps(log_record)
             )
             > 0
         )
@@ -841,7 +1085,7 @@ class KartonBackend:
         p = self.redis.pipeline()
         channel = self._log_channel(logger_name, level)
         for log_record in log_records:
-            p.publish(channel, json.dumps(log_record))
+            p.publish(channel, json_dumps(log_record))
         p.execute()
 
     def consume_log(
@@ -869,14 +1113,18 @@ class KartonBackend:
                     ignore_subscribe_messages=True, timeout=timeout
                 )
                 if item and item["type"] == "pmessage":
-                    body = json.loads(item["data"])
+                    body = json_loads(item["data"])
+                    # Compatibility with older producers that embed task
+                    # as a serialized JSON string
                     if "task" in body and isinstance(body["task"], str):
-                        body["task"] = json.loads(body["task"])
+                        body["task"] = json_loads(body["task"])
                     yield body
-                yield None
+                else:
+                    # No log record received until timeout
+                    yield None
 
     def increment_metrics(
-        self, metric: KartonMetrics, identity: str, pipe: Optional[Pipeline] = None
+        self, metric: KartonMetrics, identity: str, pipe: Optional[AnyPipeline] = None
     ) -> None:
         """
         Increments metrics for given operation type and identity
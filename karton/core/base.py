@@ -4,6 +4,7 @@ import logging
 import os
 import textwrap
 from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import Optional, Union, cast
 
 from .__version__ import __version__
@@ -65,7 +66,43 @@ class KartonBase(abc.ABC):
         self._log_handler = KartonLogHandler(
             backend=self.backend, channel=self.identity
         )
-        self.current_task: Optional[Task] = None
+        self._current_task: Optional[Task] = None
+        # Set only if tasks are processed concurrently
+        self._current_task_var: Optional[ContextVar[Optional[Task]]] = None
+
+    @property
+    def current_task(self) -> Optional[Task]:
+        """
+        Task that is currently processed by Karton service
+
+        If tasks are processed concurrently, it's the task processed by
+        the current thread (or asyncio task).
+        """
+        if self._current_task_var is None:
+            return self._current_task
+        return self._current_task_var.get()
+
+    @current_task.setter
+    def current_task(self, task: Optional[Task]) -> None:
+        if self._current_task_var is None:
+            self._current_task = task
+        else:
+            self._current_task_var.set(task)
+
+    def _use_context_local_task(self) -> None:
+        """
+        Keeps current task separately for each thread (or asyncio task),
+        so concurrently processed tasks don't overwrite each other.
+
+        Threads started by the service don't inherit it, so it's used only
+        when it's really needed.
+
+        :meta private:
+        """
+        self._current_task_var = ContextVar(
+            "karton_current_task", default=self._current_task
+        )
+        self._log_handler.use_context_local_task()
 
     def setup_logger(self, level: Optional[Union[str, int]] = None) -> None:
         """
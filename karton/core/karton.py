@@ -3,18 +3,29 @@ Base library for karton subsystems.
 """
 import abc
 import argparse
+import asyncio
+import contextvars
+import functools
 import sys
+import threading
 import time
 import traceback
-from typing import Any, Callable, Dict, List, Optional, Tuple, cast
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple, cast
 
 from .__version__ import __version__
-from .backend import KartonBackend, KartonBind, KartonMetrics
+from .backend import (
+    AnyPipeline,
+    AsyncStrictRedis,
+    KartonBackend,
+    KartonBind,
+    KartonMetrics,
+)
 from .base import KartonBase, KartonServiceBase
 from .config import Config
 from .exceptions import TaskTimeoutError
 from .resource import LocalResource
-from .task import Task, TaskState
+from .task import CompiledFilters, Task, TaskState
 from .utils import timeout
 
 
@@ -50,6 +61,10 @@ class Producer(KartonBase):
     :param backend: Karton backend to use
     """
 
+    #: Maximum number of resources uploaded concurrently by a single send_task call.
+    #: Keep it below the S3 client connection pool size (10 by default)
+    upload_concurrency: int = 8
+
     def __init__(
         self,
         config: Optional[Config] = None,
@@ -58,17 +73,14 @@ class Producer(KartonBase):
     ) -> None:
         super().__init__(config=config, identity=identity, backend=backend)
 
-    def send_task(self, task: Task) -> bool:
+    def _complete_task(self, task: Task) -> None:
         """
-        Sends a task to the unrouted task queue. Takes care of logging.
-        Given task will be child of task we are currently handling (if such exists).
+        Completes information about the task before it's sent.
 
-        :param task: Task object to be sent
-        :return: Bool indicating if the task was delivered
-        """
-        self.log.debug("Dispatched task %s", task.uid)
+        :param task: Task object to be completed
 
-        # Complete information about task
+        :meta private:
+        """
         if self.current_task is not None:
             task.set_task_parent(self.current_task)
             task.merge_persistent_payload(self.current_task)
@@ -76,24 +88,93 @@ class Producer(KartonBase):
             task.priority = self.current_task.priority
 
         task.last_update = time.time()
-        task.headers.update({"origin": self.identity})
+        task.headers["origin"] = self.identity
 
-        # Ensure all local resources have good buckets
-        for resource in task.iterate_resources():
-            if isinstance(resource, LocalResource) and not resource.bucket:
-                resource.bucket = self.backend.default_bucket_name
+    def _upload_resources(self, resources: List[LocalResource]) -> None:
+        """
+        Uploads local resources, concurrently if there are more than one.
+
+        :param resources: List of local resources to upload
+
+        :meta private:
+        """
+        if len(resources) == 1:
+            resources[0].upload(self.backend)
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=min(len(resources), self.upload_concurrency),
+            thread_name_prefix="karton-upload",
+        ) as executor:
+            futures = [
+                executor.submit(resource.upload, self.backend) for resource in resources
+            ]
+        # Reraise the first upload error (if any)
+        for future in futures:
+            future.result()
+
+    def send_task(self, task: Task) -> bool:
+        """
+        Sends a task to the unrouted task queue. Takes care of logging.
+        Given task will be child of task we are currently handling (if such exists).
+
+        :param task: Task object to be sent
+        :return: Bool indicating if the task was delivered
+        """
+        return self.send_tasks([task])
+
+    def send_tasks(self, tasks: Iterable[Task]) -> bool:
+        """
+        Sends multiple tasks to the unrouted task queue.
+        Works like :py:meth:`send_task` called for each task, but Redis
+        operations for all tasks are sent in a single pipeline.
 
-        # Register new task
-        self.backend.register_task(task)
+        :param tasks: Task objects to be sent
+        :return: Bool indicating if the tasks were delivered
+        """
+        tasks = list(tasks)
+        if not tasks:
+            return True
+
+        for task in tasks:
+            self.log.debug("Dispatched task %s", task.uid)
+            self._complete_task(task)
+
+        # The same resource object may be referenced more than once,
+        # but it needs to be uploaded only once
+        local_resources = list(
+            {
+                id(resource): resource
+                for task in tasks
+                for resource in task.iterate_resources()
+                if isinstance(resource, LocalResource)
+            }.values()
+        )
 
-        # Upload local resources
-        for resource in task.iterate_resources():
-            if isinstance(resource, LocalResource):
-                resource.upload(self.backend)
+        # Ensure all local resources have good buckets
+        for resource in local_resources:
+            if not resource.bucket:
+                resource.bucket = self.backend.default_bucket_name
 
-        # Add task to karton.tasks
-        self.backend.produce_unrouted_task(task)
-        self.backend.increment_metrics(KartonMetrics.TASK_PRODUCED, self.identity)
+        pipe = self.backend.make_pipeline()
+
+        # Register new tasks
+        for task in tasks:
+            self.backend.register_task(task, pipe=pipe)
+
+        if local_resources:
+            # Tasks must be registered before upload to lock the references
+            # to the resources, so they're not collected by karton-system GC
+            pipe.execute()
+            self._upload_resources(local_resources)
+
+        # Add tasks to karton.tasks
+        for task in tasks:
+            self.backend.produce_unrouted_task(task, pipe=pipe)
+            self.backend.increment_metrics(
+                KartonMetrics.TASK_PRODUCED, self.identity, pipe=pipe
+            )
+        pipe.execute()
         return True
 
 
@@ -110,6 +191,15 @@ class Consumer(KartonServiceBase):
     filters: List[Dict[str, Any]] = []
     persistent: bool = True
     version: Optional[str] = None
+    prefetch_count: int = 1
+    #: Number of tasks processed concurrently in separate threads. If above 1,
+    #: current task is known only by threads (and asyncio tasks) managed by Karton
+    concurrency: int = 1
+    #: Run task hooks concurrently in a thread pool. Use it only if hooks
+    #: don't depend on each other's side effects (e.g. IO-bound metrics hooks)
+    parallel_hooks: bool = False
+    # task_timeout relies on SIGALRM which can be handled only in main thread
+    _signal_task_timeout: bool = True
 
     def __init__(
         self,
@@ -127,7 +217,18 @@ class Consumer(KartonServiceBase):
             and not self.debug
         )
         self.task_timeout = self.config.getint("karton", "task_timeout")
-        self.current_task: Optional[Task] = None
+        self.prefetch_count = self.config.getint(
+            "karton", "prefetch_count", self.prefetch_count
+        )
+        if self.prefetch_count < 1:
+            raise ValueError("prefetch_count must be a positive integer")
+        self.concurrency = self.config.getint("karton", "concurrency", self.concurrency)
+        if self.concurrency < 1:
+            raise ValueError("concurrency must be a positive integer")
+        if self.concurrency > 1 and self.task_timeout and self._signal_task_timeout:
+            raise ValueError("task_timeout can't be used when concurrency is above 1")
+        if self.concurrency > 1:
+            self._use_context_local_task()
         self._pre_hooks: List[Tuple[Optional[str], Callable[[Task], None]]] = []
         self._post_hooks: List[
             Tuple[
@@ -135,6 +236,7 @@ class Consumer(KartonServiceBase):
                 Callable[[Task, Optional[BaseException]], None],
             ]
         ] = []
+        self._hook_executor: Optional[ThreadPoolExecutor] = None
 
     @abc.abstractmethod
     def process(self, task: Task) -> None:
@@ -159,20 +261,15 @@ class Consumer(KartonServiceBase):
         :meta private:
         """
 
-        self.current_task = task
-        self.log_handler.set_task(self.current_task)
-
-        if not self.current_task.matches_filters(self.filters):
-            self.log.info("Task rejected because binds are no longer valid.")
-            self.backend.set_task_status(self.current_task, TaskState.FINISHED)
+        if not self._accept_task(task):
             # Task rejected: end of processing
             return
 
         exception_str = None
 
         try:
-            self.log.info("Received new task - %s", self.current_task.uid)
-            self.backend.set_task_status(self.current_task, TaskState.STARTED)
+            self.log.info("Received new task - %s", task.uid)
+            self.backend.set_task_status(task, TaskState.STARTED)
 
             self._run_pre_hooks()
 
@@ -180,37 +277,88 @@ class Consumer(KartonServiceBase):
             try:
                 if self.task_timeout:
                     with timeout(self.task_timeout):
-                        self.process(self.current_task)
+                        self.process(task)
                 else:
-                    self.process(self.current_task)
+                    self.process(task)
             except (Exception, TaskTimeoutError) as exc:
                 saved_exception = exc
                 raise
             finally:
                 self._run_post_hooks(saved_exception)
 
-            self.log.info("Task done - %s", self.current_task.uid)
+            self.log.info("Task done - %s", task.uid)
         except (Exception, TaskTimeoutError):
             exc_info = sys.exc_info()
             exception_str = traceback.format_exception(*exc_info)
 
-            self.backend.increment_metrics(KartonMetrics.TASK_CRASHED, self.identity)
-            self.log.exception("Failed to process task - %s", self.current_task.uid)
+            self.log.exception("Failed to process task - %s", task.uid)
         finally:
-            self.backend.increment_metrics(KartonMetrics.TASK_CONSUMED, self.identity)
+            # Metrics and final task status are sent in a single pipeline
+            pipe = self.backend.make_pipeline()
+            self._report_task_result(task, exception_str, pipe)
+            pipe.execute()
 
-            task_state = TaskState.FINISHED
+    def _accept_task(self, task: Task, pipe: Optional[AnyPipeline] = None) -> bool:
+        """
+        Sets the current task and checks whether it still matches consumer binds.
+        Rejected task is marked as finished.
+
+        :param task: Task object to process
+        :param pipe: Optional pipeline object for rejected task status change
+        :return: True if task can be processed
+
+        :meta private:
+        """
+        self.current_task = task
+        if self.log_handler.task is not task:
+            self.log_handler.set_task(task)
 
-            # report the task status as crashed
-            # if an exception was caught while processing
-            if exception_str is not None:
-                task_state = TaskState.CRASHED
-                self.current_task.error = exception_str
+        if not task.matches_filters(self._compiled_filters):
+            self.log.info("Task rejected because binds are no longer valid.")
+            self.backend.set_task_status(task, TaskState.FINISHED, pipe=pipe)
+            return False
+
+        # Tasks are consumed without parsing resources, so rejected ones
+        # don't pay for it. Finish deserialization only for accepted tasks.
+        task.unserialize_resources(self.backend)
+        return True
+
+    def _report_task_result(
+        self, task: Task, exception_str: Optional[List[str]], pipe: AnyPipeline
+    ) -> None:
+        """
+        Adds metrics and final task status to the pipeline
 
-            self.backend.set_task_status(self.current_task, task_state)
+        :param task: Processed task object
+        :param exception_str: Formatted exception if task crashed
+        :param pipe: Pipeline object
 
-    @property
+        :meta private:
+        """
+        self.backend.increment_metrics(
+            KartonMetrics.TASK_CONSUMED, self.identity, pipe=pipe
+        )
+
+        task_state = TaskState.FINISHED
+
+        # report the task status as crashed
+        # if an exception was caught while processing
+        if exception_str is not None:
+            task_state = TaskState.CRASHED
+            task.error = exception_str
+            self.backend.increment_metrics(
+                KartonMetrics.TASK_CRASHED, self.identity, pipe=pipe
+            )
+
+        self.backend.set_task_status(task, task_state, pipe=pipe)
+
+    @functools.cached_property
+    def _compiled_filters(self) -> CompiledFilters:
+        return CompiledFilters(self.filters)
+
+    @functools.cached_property
     def _bind(self) -> KartonBind:
+        # Binds are fixed after initialization, so it's computed only once
         return KartonBind(
             identity=self.identity,
             info=self.__class__.__doc__,
@@ -278,20 +426,91 @@ class Consumer(KartonServiceBase):
         """
         self._post_hooks.append((name, callback))
 
-    def _run_pre_hooks(self) -> None:
+    def _get_hook_executor(self) -> ThreadPoolExecutor:
         """
-        Run registered preprocessing hooks
+        Return thread pool used for running hooks concurrently
+
+        :meta private:
+        """
+        if self._hook_executor is None:
+            self._hook_executor = ThreadPoolExecutor(
+                max_workers=max(len(self._pre_hooks), len(self._post_hooks), 1),
+                thread_name_prefix="karton-hook",
+            )
+        return self._hook_executor
+
+    def _run_hook(self, task: Task, callback: Callable[..., None], *args: Any) -> None:
+        """
+        Run hook in thread pool with current task set for that thread
 
         :meta private:
         """
-        for name, callback in self._pre_hooks:
+        # Current task may be shared by all threads, so it's restored
+        # instead of being unset
+        previous_task = self.current_task
+        self.current_task = task
+        if self.log_handler.task is not task:
+            self.log_handler.set_task(task)
+        try:
+            callback(*args)
+        finally:
+            self.current_task = previous_task
+
+    def _run_hooks(
+        self,
+        hook_type: str,
+        hooks: Sequence[Tuple[Optional[str], Callable[..., None]]],
+        *args: Any,
+    ) -> None:
+        """
+        Run hooks with given arguments and log failures of particular hooks
+
+        :param hook_type: Hook type name used in log messages
+        :param hooks: List of hooks to run
+        :param args: Arguments passed to the hooks
+
+        :meta private:
+        """
+
+        def log_failure(name: Optional[str]) -> None:
+            if name:
+                self.log.exception("%s (%s) failed", hook_type, name)
+            else:
+                self.log.exception("%s failed", hook_type)
+
+        if self.parallel_hooks and len(hooks) > 1:
+            task = cast(Task, self.current_task)
+            executor = self._get_hook_executor()
+            futures = [
+                executor.submit(self._run_hook, task, callback, *args)
+                for _, callback in hooks
+            ]
+            for (name, _), future in zip(hooks, futures):
+                try:
+                    future.result()
+                except Exception:
+                    log_failure(name)
+            return
+
+        # Hooks rarely fail, so the whole loop is guarded by a single try block
+        # and it's resumed after the failed hook only if needed
+        idx = 0
+        while idx < len(hooks):
             try:
-                callback(cast(Task, self.current_task))
+                for idx in range(idx, len(hooks)):
+                    hooks[idx][1](*args)
+                return
             except Exception:
-                if name:
-                    self.log.exception("Pre-hook (%s) failed", name)
-                else:
-                    self.log.exception("Pre-hook failed")
+                log_failure(hooks[idx][0])
+                idx += 1
+
+    def _run_pre_hooks(self) -> None:
+        """
+        Run registered preprocessing hooks
+
+        :meta private:
+        """
+        self._run_hooks("Pre-hook", self._pre_hooks, cast(Task, self.current_task))
 
     def _run_post_hooks(self, exception: Optional[BaseException]) -> None:
         """
@@ -301,19 +520,13 @@ class Consumer(KartonServiceBase):
 
         :meta private:
         """
-        for name, callback in self._post_hooks:
-            try:
-                callback(cast(Task, self.current_task), exception)
-            except Exception:
-                if name:
-                    self.log.exception("Post-hook (%s) failed", name)
-                else:
-                    self.log.exception("Post-hook failed")
+        self._run_hooks(
+            "Post-hook", self._post_hooks, cast(Task, self.current_task), exception
+        )
 
-    def loop(self) -> None:
+    def _register_bind(self) -> None:
         """
-        Blocking loop that consumes tasks and runs
-        :py:meth:`karton.Consumer.process` as a handler
+        Registers consumer bind before consuming tasks
 
         :meta private:
         """
@@ -333,14 +546,332 @@ class Consumer(KartonServiceBase):
         for task_filter in self.filters:
             self.log.info("Binding on: %s", task_filter)
 
+    def loop(self) -> None:
+        """
+        Blocking loop that consumes tasks and runs
+        :py:meth:`karton.Consumer.process` as a handler
+
+        :meta private:
+        """
+        self._register_bind()
+
+        task_executor: Optional[ThreadPoolExecutor] = None
+        if self.concurrency > 1:
+            self.log.info("Processing up to %d tasks concurrently", self.concurrency)
+            task_executor = ThreadPoolExecutor(
+                max_workers=self.concurrency, thread_name_prefix="karton-worker"
+            )
+        # Limits number of tasks submitted to the executor
+        free_workers = threading.BoundedSemaphore(self.concurrency)
+
+        def process_task(task: Task) -> None:
+            try:
+                self.internal_process(task)
+            finally:
+                self.current_task = None
+                free_workers.release()
+
+        # Errors that are not caught by internal_process stop the service,
+        # even if they're raised in a worker thread
+        worker_errors: List[BaseException] = []
+
+        def on_task_done(future: "Future[None]") -> None:
+            exc = future.exception()
+            if exc is not None:
+                self.log.error("Worker failed, shutting down.", exc_info=exc)
+                worker_errors.append(exc)
+                self._shutdown = True
+
         with self.graceful_killer():
-            while not self.shutdown:
-                if self.backend.get_bind(self.identity) != self._bind:
-                    self.log.info("Binds changed, shutting down.")
+            try:
+                while not self.shutdown:
+                    if task_executor is not None:
+                        # Don't fetch new tasks until there is a free worker
+                        with free_workers:
+                            pass
+                    bind, tasks = self.backend.consume_routed_tasks(
+                        self.identity,
+                        max_count=self.prefetch_count,
+                        parse_resources=False,
+                    )
+                    # Prefetched tasks that are not taken for processing yet
+                    tasks_left = tasks
+                    try:
+                        if bind != self._bind:
+                            self.log.info("Binds changed, shutting down.")
+                            break
+                        for idx, task in enumerate(tasks):
+                            free_workers.acquire()
+                            if self.shutdown:
+                                free_workers.release()
+                                break
+                            tasks_left = tasks[idx + 1 :]
+                            if task_executor is not None:
+                                future = task_executor.submit(process_task, task)
+                                future.add_done_callback(on_task_done)
+                            else:
+                                process_task(task)
+                    finally:
+                        # Give back prefetched tasks to other replicas, also
+                        # when processing has been interrupted by an error
+                        self.backend.restore_routed_tasks(self.identity, tasks_left)
+            finally:
+                if task_executor is not None:
+                    # Wait for tasks that are still processed
+                    task_executor.shutdown(wait=True)
+                if self._hook_executor is not None:
+                    self._hook_executor.shutdown(wait=True)
+                    # Next hooks will get a new executor
+                    self._hook_executor = None
+            if worker_errors:
+                raise worker_errors[0]
+
+
+class AsyncConsumer(Consumer):
+    """
+    Consumer that processes up to ``concurrency`` tasks at once in a single
+    process using asyncio.
+
+    Tasks are consumed using asyncio Redis connection pool, so workers don't need
+    separate threads to wait for incoming tasks. Implement
+    :py:meth:`process_async` coroutine to process the task without blocking
+    the event loop. Synchronous :py:meth:`Consumer.process` implementations are
+    supported as well and they're run in a thread pool, like task hooks.
+
+    Enforced ``task_timeout`` cancels :py:meth:`process_async`. Synchronous
+    :py:meth:`Consumer.process` can't be interrupted, so task is reported as
+    crashed, but it runs in its thread until it returns. Task hooks are run in
+    a separate thread pool, so they don't wait for it, but the thread is not
+    given back to the worker: if all threads are busy, the next synchronous
+    :py:meth:`Consumer.process` call waits until one of them returns.
+
+    Logging and :py:meth:`Producer.send_task` use synchronous Redis and S3 clients,
+    so they block the event loop when called from :py:meth:`process_async`.
+    Keep logging in coroutines short and use :py:class:`AsyncKarton` with
+    :py:meth:`AsyncKarton.send_task_async` to send tasks from them.
+
+    :param config: Karton config to use for service configuration
+    :param identity: Karton service identity
+    :param backend: Karton backend to use
+    """
+
+    _signal_task_timeout = False
+
+    def __init__(
+        self,
+        config: Optional[Config] = None,
+        identity: Optional[str] = None,
+        backend: Optional[KartonBackend] = None,
+    ) -> None:
+        # Both methods have default implementations calling each other,
+        # so at least one of them must be implemented
+        if (
+            type(self).process is AsyncConsumer.process
+            and type(self).process_async is AsyncConsumer.process_async
+        ):
+            raise TypeError(
+                f"Can't instantiate {type(self).__name__} without "
+                "process or process_async method"
+            )
+        super().__init__(config=config, identity=identity, backend=backend)
+        self._task_executor: Optional[ThreadPoolExecutor] = None
+        # Runs task hooks, so they don't wait for timed out process() calls
+        self._hook_runner_executor: Optional[ThreadPoolExecutor] = None
+
+    def process(self, task: Task) -> None:
+        """
+        Synchronous task processing method. Implement it or
+        :py:meth:`process_async`.
+
+        By default it runs :py:meth:`process_async` in a new event loop.
+
+        :param task: The incoming task object
+        """
+        asyncio.run(self.process_async(task))
+
+    async def process_async(self, task: Task) -> None:
+        """
+        Asynchronous task processing method.
+
+        By default it runs :py:meth:`Consumer.process` in a thread pool.
+
+        :param task: The incoming task object
+        """
+        await self._run_in_executor(self.process, task)
+
+    async def _run_in_executor(
+        self,
+        func: Callable[..., Any],
+        *args: Any,
+        executor: Optional[ThreadPoolExecutor] = None,
+    ) -> Any:
+        """
+        Runs synchronous function in a thread pool with current task set
+
+        :param func: Function to run
+        :param args: Arguments passed to the function
+        :param executor: Thread pool to use instead of the one running tasks
+
+        :meta private:
+        """
+        context = contextvars.copy_context()
+        return await asyncio.get_running_loop().run_in_executor(
+            executor or self._task_executor,
+            functools.partial(context.run, func, *args),
+        )
+
+    async def internal_process_async(self, redis: AsyncStrictRedis, task: Task) -> None:
+        """
+        Asyncio variant of :py:meth:`Consumer.internal_process`
+
+        :param redis: Redis connection used for task state updates
+        :param task: Task object to process
+
+        :meta private:
+        """
+        pipe = redis.pipeline(transaction=False)
+        if not self._accept_task(task, pipe=pipe):
+            await pipe.execute()
+            # Task rejected: end of processing
+            return
+
+        exception_str = None
+
+        try:
+            self.log.info("Received new task - %s", task.uid)
+            self.backend.set_task_status(task, TaskState.STARTED, pipe=pipe)
+            await pipe.execute()
+
+            await self._run_in_executor(
+                self._run_pre_hooks, executor=self._hook_runner_executor
+            )
+
+            saved_exception = None
+            try:
+                if self.task_timeout:
+                    try:
+                        await asyncio.wait_for(
+                            self.process_async(task), self.task_timeout
+                        )
+                    except asyncio.TimeoutError:
+                        raise TaskTimeoutError
+                else:
+                    await self.process_async(task)
+            except (Exception, TaskTimeoutError) as exc:
+                saved_exception = exc
+                raise
+            finally:
+                await self._run_in_executor(
+                    self._run_post_hooks,
+                    saved_exception,
+                    executor=self._hook_runner_executor,
+                )
+
+            self.log.info("Task done - %s", task.uid)
+        except (Exception, TaskTimeoutError):
+            exc_info = sys.exc_info()
+            exception_str = traceback.format_exception(*exc_info)
+
+            self.log.exception("Failed to process task - %s", task.uid)
+        finally:
+            pipe = redis.pipeline(transaction=False)
+            self._report_task_result(task, exception_str, pipe)
+            await pipe.execute()
+
+    async def _worker(self, redis: AsyncStrictRedis) -> None:
+        """
+        Consumes and processes tasks one by one until shutdown is requested
+
+        :meta private:
+        """
+        while not self.shutdown:
+            bind, tasks = await self.backend.consume_routed_tasks_async(
+                redis,
+                self.identity,
+                max_count=self.prefetch_count,
+                parse_resources=False,
+            )
+            # Prefetched tasks that are not taken for processing yet
+            tasks_left = tasks
+            try:
+                if bind != self._bind:
+                    if not self.shutdown:
+                        self.log.info("Binds changed, shutting down.")
+                        self._shutdown = True
                     break
-                task = self.backend.consume_routed_task(self.identity)
-                if task:
-                    self.internal_process(task)
+                for idx, task in enumerate(tasks):
+                    if self.shutdown:
+                        break
+                    tasks_left = tasks[idx + 1 :]
+                    try:
+                        await self.internal_process_async(redis, task)
+                    finally:
+                        self.current_task = None
+            finally:
+                if tasks_left:
+                    # Give back prefetched tasks to other replicas, also
+                    # when processing has been interrupted by an error
+                    pipe = redis.pipeline(transaction=False)
+                    self.backend.restore_routed_tasks(
+                        self.identity, tasks_left, pipe=pipe
+                    )
+                    await pipe.execute()
+
+    async def _async_loop(self) -> None:
+        """
+        Runs ``concurrency`` workers sharing single Redis connection pool
+
+        :meta private:
+        """
+        # Each worker holds at most one connection at a time
+        redis = await self.backend.make_async_redis(
+            self.backend.config,
+            identity=self.backend.identity,
+            service_info=self.backend.service_info,
+            max_connections=self.concurrency,
+        )
+        self._task_executor = ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix="karton-worker"
+        )
+        self._hook_runner_executor = ThreadPoolExecutor(
+            max_workers=self.concurrency, thread_name_prefix="karton-hook-runner"
+        )
+        workers = [
+            asyncio.ensure_future(self._worker(redis)) for _ in range(self.concurrency)
+        ]
+        try:
+            await asyncio.gather(*workers)
+        finally:
+            # If one of workers has failed, the other ones are stopped as well,
+            # so they give back their prefetched tasks
+            self._shutdown = True
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            # Wait for synchronous functions that are still running
+            # without blocking the event loop
+            loop = asyncio.get_running_loop()
+            await loop.run_in_executor(None, self._task_executor.shutdown)
+            self._task_executor = None
+            await loop.run_in_executor(None, self._hook_runner_executor.shutdown)
+            self._hook_runner_executor = None
+            if self._hook_executor is not None:
+                await loop.run_in_executor(None, self._hook_executor.shutdown)
+                self._hook_executor = None
+            await redis.connection_pool.disconnect()
+
+    def loop(self) -> None:
+        """
+        Blocking loop that consumes tasks and runs
+        :py:meth:`karton.AsyncConsumer.process_async` as a handler
+
+        :meta private:
+        """
+        self._register_bind()
+        self.log.info("Processing up to %d tasks concurrently", self.concurrency)
+
+        with self.graceful_killer():
+            asyncio.run(self._async_loop())
 
 
 class LogConsumer(KartonServiceBase):
@@ -452,3 +983,19 @@ class Karton(Consumer, Producer):
         """
         task = Task({"type": "karton.signaling.status", "status": status})
         self.send_task(task)
+
+
+class AsyncKarton(AsyncConsumer, Karton):
+    """
+    This glues together AsyncConsumer and Producer
+    """
+
+    async def send_task_async(self, task: Task) -> bool:
+        """
+        Runs :py:meth:`Producer.send_task` in a thread pool, so uploading
+        resources and sending the task don't block the event loop.
+
+        :param task: Task object to be sent
+        :return: Bool indicating if the task was delivered
+        """
+        return await self._run_in_executor(self.send_task, task)
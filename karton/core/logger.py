@@ -2,6 +2,7 @@ import logging
 import platform
 import traceback
 import warnings
+from contextvars import ContextVar
 from typing import Optional
 
 from .backend import KartonBackend
@@ -18,11 +19,33 @@ class KartonLogHandler(logging.Handler):
     def __init__(self, backend: KartonBackend, channel: str) -> None:
         logging.Handler.__init__(self)
         self.backend = backend
-        self.task: Optional[Task] = None
+        self._task: Optional[Task] = None
+        # Set only if tasks are processed concurrently
+        self._task_var: Optional[ContextVar[Optional[Task]]] = None
         self.is_consumer_active: bool = True
         self.channel: str = channel
 
-    def set_task(self, task: Task) -> None:
+    def use_context_local_task(self) -> None:
+        """
+        Keeps task separately for each thread (or asyncio task), so logs of
+        concurrently processed tasks are not mixed up.
+        """
+        self._task_var = ContextVar("karton_log_task", default=self._task)
+
+    @property
+    def task(self) -> Optional[Task]:
+        if self._task_var is None:
+            return self._task
+        return self._task_var.get()
+
+    @task.setter
+    def task(self, task: Optional[Task]) -> None:
+        if self._task_var is None:
+            self._task = task
+        else:
+            self._task_var.set(task)
+
+    def set_task(self, task: Optional[Task]) -> None:
         self.task = task
 
     def emit(self, record: logging.LogRecord) -> None:
@@ -55,7 +78,7 @@ class KartonLogHandler(logging.Handler):
         log_line["message"] = self.format(record)
 
         if self.task is not None:
-            log_line["task"] = self.task.serialize()
+            log_line["task"] = self.task.to_dict()
 
         log_line["hostname"] = HOSTNAME
 
@@ -1,6 +1,9 @@
 import enum
 import fnmatch
+import functools
+import itertools
 import json
+import re
 import time
 import uuid
 import warnings
@@ -9,6 +12,7 @@ from typing import (
     Any,
     Callable,
     Dict,
+    Iterable,
     Iterator,
     List,
     Optional,
@@ -17,7 +21,14 @@ from typing import (
 )
 
 from .resource import RemoteResource, ResourceBase
-from .utils import recursive_iter, recursive_iter_with_keys, recursive_map
+from .utils import (
+    check_orjson_keys,
+    check_orjson_value,
+    json_loads,
+    recursive_iter,
+    recursive_iter_with_keys,
+    recursive_map,
+)
 
 if TYPE_CHECKING:
     from .backend import KartonBackend  # noqa
@@ -39,6 +50,186 @@ class TaskPriority(enum.Enum):
     LOW = "low"
 
 
+# Tuple of (header key, header value matcher, is negated)
+_FilterItem = Tuple[str, Callable[[str], Any], bool]
+
+
+class CompiledFilters:
+    """
+    Task header filters preprocessed for repeated matching against task headers.
+
+    Filter values are coerced to strings, negations are parsed and wildcard
+    patterns are compiled only once. Filters are also indexed by the literal value
+    of the ``type`` header, so only filters that can match the task type are tested.
+
+    :param filters: Task header filters
+
+    :meta private:
+    """
+
+    INDEX_KEY = "type"
+
+    def __init__(self, filters: List[Dict[str, Any]]) -> None:
+        self.filters = filters
+        # Filters with literal "type" value, indexed by that value
+        self._indexed: Dict[str, List[Tuple[_FilterItem, ...]]] = {}
+        # Filters that need to be tested against every task
+        self._unindexed: List[Tuple[_FilterItem, ...]] = []
+
+        for task_filter in filters:
+            compiled_filter = self._compile_filter(task_filter)
+            index_value = self._get_index_value(task_filter)
+            if index_value is not None:
+                self._indexed.setdefault(index_value, []).append(compiled_filter)
+            else:
+                self._unindexed.append(compiled_filter)
+
+    @staticmethod
+    def _is_literal(pattern: str) -> bool:
+        return not any(char in pattern for char in "*?[")
+
+    @classmethod
+    def _compile_filter(cls, task_filter: Dict[str, Any]) -> Tuple[_FilterItem, ...]:
+        # Coerce filter values to strings
+        return cls._compile_filter_items(
+            tuple(
+                (filter_key, str(filter_value))
+                for filter_key, filter_value in task_filter.items()
+            )
+        )
+
+    @classmethod
+    @functools.lru_cache(maxsize=1024)
+    def _compile_filter_items(
+        cls, filter_items: Tuple[Tuple[str, str], ...]
+    ) -> Tuple[_FilterItem, ...]:
+        return tuple(
+            cls._compile_item(filter_key, filter_value_str)
+            for filter_key, filter_value_str in filter_items
+        )
+
+    @classmethod
+    # Compiled items are cached the same way as fnmatch.fnmatchcase caches
+    # compiled patterns, so filters that are compiled repeatedly are cheap
+    @functools.lru_cache(maxsize=32768)
+    def _compile_item(cls, filter_key: str, filter_value_str: str) -> _FilterItem:
+        negated = False
+        if filter_value_str.startswith("!"):
+            negated = True
+            filter_value_str = filter_value_str[1:]
+
+        if cls._is_literal(filter_value_str):
+            # Pattern without wildcards matches only the exact value
+            return filter_key, filter_value_str.__eq__, negated
+        # fnmatch is great for handling simple wildcard patterns (?, *, [abc])
+        # Pattern is translated the same way as fnmatch.fnmatchcase does
+        regex = re.compile(fnmatch.translate(filter_value_str))
+        return filter_key, regex.match, negated
+
+    @classmethod
+    def _get_index_value(cls, task_filter: Dict[str, Any]) -> Optional[str]:
+        if cls.INDEX_KEY not in task_filter:
+            return None
+        filter_value_str = str(task_filter[cls.INDEX_KEY])
+        # Only positive literal values can be indexed
+        if filter_value_str.startswith("!") or not cls._is_literal(filter_value_str):
+            return None
+        return filter_value_str
+
+    @staticmethod
+    def _test_filter(
+        headers: Dict[str, Any], compiled_filter: Tuple[_FilterItem, ...]
+    ) -> int:
+        """
+        Filter match follows AND logic, but it's non-boolean because filters may be
+        negated (task:!platform).
+
+        Result values are as follows:
+        - 1  - positive match, no mismatched values in headers
+               (all matched)
+        - 0  - no match, found value that doesn't match to the filter
+               (some are not matched)
+        - -1 - negative match, found value that matches negated filter value
+               (all matched but found negative matches)
+        """
+        matches = 1
+        for filter_key, matcher, negated in compiled_filter:
+            # If expected key doesn't exist in headers
+            if filter_key not in headers:
+                # Negated filter ignores non-existent values
+                if negated:
+                    continue
+                # But positive filter doesn't
+                return 0
+
+            # Coerce header value to string
+            header_value_str = str(headers[filter_key])
+            match = bool(matcher(header_value_str))
+            # If matches, but it's negated: it's negative match
+            if match and negated:
+                matches = -1
+            # If doesn't match but filter is not negated: it's not a match
+            if not match and not negated:
+                return 0
+        # If there are no mismatched values: filter is matched
+        return matches
+
+    def matches(self, headers: Dict[str, Any]) -> bool:
+        """
+        Checks whether provided task headers match filters
+
+        :param headers: Task headers
+        :return: True if task headers match specific filters
+        """
+        candidates: Iterable[Tuple[_FilterItem, ...]] = self._unindexed
+        if self.INDEX_KEY in headers:
+            indexed = self._indexed.get(str(headers[self.INDEX_KEY]))
+            if indexed:
+                candidates = itertools.chain(indexed, self._unindexed)
+        return self._match_filters(headers, candidates)
+
+    @classmethod
+    def match_raw_filters(
+        cls, headers: Dict[str, Any], filters: List[Dict[str, Any]]
+    ) -> bool:
+        """
+        Checks whether provided task headers match filters that are not
+        preprocessed. Filters are tested one by one without building the index,
+        which is cheaper when they're used only once.
+
+        :param headers: Task headers
+        :param filters: Task header filters
+        :return: True if task headers match specific filters
+        """
+        return cls._match_filters(
+            headers, (cls._compile_filter(task_filter) for task_filter in filters)
+        )
+
+    @classmethod
+    def _match_filters(
+        cls,
+        headers: Dict[str, Any],
+        compiled_filters: Iterable[Tuple[_FilterItem, ...]],
+    ) -> bool:
+        # List of filter matches follow OR logic, but -1 is special
+        # If there is any -1, result is False
+        #   (any matched, but it's negative match)
+        # If there is any 1, but no -1's: result is True
+        #   (any matched, no negative match)
+        # If there are only 0's: result is False
+        #   (none matched)
+        matches = False
+        for compiled_filter in compiled_filters:
+            match_result = cls._test_filter(headers, compiled_filter)
+            if match_result == -1:
+                # Any negative match results in False
+                return False
+            if match_result == 1:
+                # Any positive match but without negative matches results in True
+                matches = True
+        return matches
+
+
 class Task(object):
     """
     Task representation with headers and resources.
@@ -222,76 +413,20 @@ class Task(object):
         )
         return new_task
 
-    def matches_filters(self, filters: List[Dict[str, Any]]) -> bool:
+    def matches_filters(
+        self, filters: Union[List[Dict[str, Any]], "CompiledFilters"]
+    ) -> bool:
         """
         Checks whether provided task headers match filters
 
-        :param filters: Task header filters
+        :param filters: Task header filters or :class:`CompiledFilters` object
         :return: True if task headers match specific filters
 
         :meta private:
         """
-
-        def test_filter(headers: Dict[str, Any], filter: Dict[str, Any]) -> int:
-            """
-            Filter match follows AND logic, but it's non-boolean because filters may be
-            negated (task:!platform).
-
-            Result values are as follows:
-            - 1  - positive match, no mismatched values in headers
-                   (all matched)
-            - 0  - no match, found value that doesn't match to the filter
-                   (some are not matched)
-            - -1 - negative match, found value that matches negated filter value
-                   (all matched but found negative matches)
-            """
-            matches = 1
-            for filter_key, filter_value in filter.items():
-                # Coerce filter value to string
-                filter_value_str = str(filter_value)
-                negated = False
-                if filter_value_str.startswith("!"):
-                    negated = True
-                    filter_value_str = filter_value_str[1:]
-
-                # If expected key doesn't exist in headers
-                if filter_key not in headers:
-                    # Negated filter ignores non-existent values
-                    if negated:
-                        continue
-                    # But positive filter doesn't
-                    return 0
-
-                # Coerce header value to string
-                header_value_str = str(headers[filter_key])
-                # fnmatch is great for handling simple wildcard patterns (?, *, [abc])
-                match = fnmatch.fnmatchcase(header_value_str, filter_value_str)
-                # If matches, but it's negated: it's negative match
-                if match and negated:
-                    matches = -1
-                # If doesn't match but filter is not negated: it's not a match
-                if not match and not negated:
-                    return 0
-            # If there are no mismatched values: filter is matched
-            return matches
-
-        # List of filter matches follow OR logic, but -1 is special
-        # If there is any -1, result is False
-        #   (any matched, but it's negative match)
-        # If there is any 1, but no -1's: result is True
-        #   (any matched, no negative match)
-        # If there are only 0's: result is False
-        #   (none matched)
-        matches = False
-        for task_filter in filters:
-            match_result = test_filter(self.headers, task_filter)
-            if match_result == -1:
-                # Any negative match results in False
-                return False
-            if match_result == 1:
-                # Any positive match but without negative matches results in True
-                matches = True
-        return matches
+        if isinstance(filters, CompiledFilters):
+            return filters.matches(self.headers)
+        return CompiledFilters.match_raw_filters(self.headers, filters)
 
     def set_task_parent(self, parent: "Task"):
         """
@@ -336,19 +471,43 @@ class Task(object):
         Transform task data into dictionary
         :return: Task data dictionary
 
+        :meta private:
+        """
+        return self._to_dict(strict=False)
+
+    def _to_dict(self, strict: bool) -> Dict[str, Any]:
+        """
+        Transform task data into dictionary
+
+        :param strict: |
+            If set to True, ValueError is raised for headers and payload values
+            that orjson wouldn't store the same way as json module does
+            (e.g. NaN, datetime or Enum objects)
+        :return: Task data dictionary
+
         :meta private:
         """
 
         def serialize_resources(obj):
             if type(obj) is dict:
+                if strict:
+                    check_orjson_keys(obj)
                 return {k: serialize_resources(v) for k, v in obj.items()}
             elif type(obj) is list or type(obj) is tuple:
                 return [serialize_resources(v) for v in obj]
             elif isinstance(obj, ResourceBase):
                 return {"__karton_resource__": obj.to_dict()}
             else:
+                if strict:
+                    check_orjson_value(obj)
                 return obj
 
+        if strict:
+            for headers in (self.headers, self.headers_persistent):
+                check_orjson_keys(headers)
+                for header_value in headers.values():
+                    check_orjson_value(header_value)
+
         headers_persistent = self.headers_persistent
         payload_persistent = {
             **self.payload_persistent,
@@ -382,6 +541,20 @@ class Task(object):
 
         :meta private:
         """
+        if indent is None:
+            try:
+                return orjson.dumps(
+                    self._to_dict(strict=True),
+                    option=orjson.OPT_SORT_KEYS
+                    | orjson.OPT_PASSTHROUGH_DATETIME
+                    | orjson.OPT_PASSTHROUGH_DATACLASS,
+                ).decode("utf8")
+            except (TypeError, ValueError):
+                # orjson doesn't support some values (e.g. integers above 64-bit)
+                # and it would store other ones differently than json module
+                # (e.g. NaN as null or datetime as string). json module is used
+                # for them, so unsupported values are rejected as before.
+                pass
         return json.dumps(
             self.to_dict(),
             indent=indent,
@@ -453,29 +626,15 @@ class Task(object):
             deserialize '__karton_resource__' entries, which speeds up deserialization
             process. This flag is used mainly for multiple task processing e.g.
             filtering based on status.
-            When resource deserialization is turned off, Task.unserialize will try
-            to use faster 3rd-party JSON parser (orjson).
         :return: Unserialized Task object
 
         :meta private:
         """
 
-        def unserialize_resources(value: Any) -> Any:
-            """
-            Transforms __karton_resource__ serialized entries into
-            RemoteResource object instances
-            """
-            if isinstance(value, dict) and "__karton_resource__" in value:
-                return RemoteResource.from_dict(value["__karton_resource__"], backend)
-            return value
-
         if not isinstance(data, str):
             data = data.decode("utf8")
 
-        if parse_resources:
-            task_data = json.loads(data, object_hook=unserialize_resources)
-        else:
-            task_data = orjson.loads(data)
+        task_data = json_loads(data)
 
         # Compatibility with Karton <5.2.0
         headers_persistent_fallback = task_data["payload_persistent"].get(
@@ -506,8 +665,45 @@ class Task(object):
             _status=TaskState(task_data["status"]),
             _last_update=task_data.get("last_update", None),
         )
+        if parse_resources:
+            task.unserialize_resources(backend)
         return task
 
+    def unserialize_resources(self, backend: Optional["KartonBackend"]) -> None:
+        """
+        Transforms __karton_resource__ serialized entries in task payload into
+        RemoteResource object instances.
+
+        Used to finish deserialization of tasks unserialized with
+        ``parse_resources=False`` e.g. when consumer has already checked that
+        task matches its binds. Entries that are already deserialized are left
+        intact.
+
+        :param backend: Backend instance to be bound to RemoteResource objects
+
+        :meta private:
+        """
+
+        # Only containers are visited, because calling a function for every
+        # scalar value is the main cost of payload deserialization
+        def unserialize_resources(obj: Any) -> Any:
+            if type(obj) is dict:
+                if "__karton_resource__" in obj:
+                    return RemoteResource.from_dict(obj["__karton_resource__"], backend)
+                return {
+                    k: unserialize_resources(v) if type(v) in containers else v
+                    for k, v in obj.items()
+                }
+            else:
+                return [
+                    unserialize_resources(v) if type(v) in containers else v
+                    for v in obj
+                ]
+
+        containers = (dict, list, tuple)
+        self.payload = unserialize_resources(self.payload)
+        self.payload_persistent = unserialize_resources(self.payload_persistent)
+
     def __repr__(self) -> str:
         return self.serialize()
 
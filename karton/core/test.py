@@ -1,6 +1,7 @@
 """
 Test stubs for karton subsystem unit tests
 """
+import asyncio
 import hashlib
 import logging
 import unittest
@@ -10,6 +11,7 @@ from unittest import mock
 
 from .backend import KartonBackend, KartonMetrics
 from .config import Config
+from .karton import AsyncConsumer
 from .resource import LocalResource, RemoteResource, ResourceBase
 from .task import Task, TaskState
 
@@ -24,6 +26,12 @@ class ConfigMock(Config):
         self._config = {"redis": {}, "s3": {}}
 
 
+class PipelineMock:
+    def execute(self) -> List[Any]:
+        log.debug("Executing pipeline")
+        return []
+
+
 class BackendMock:
     def __init__(self) -> None:
         self.produced_tasks: List[Task] = []
@@ -40,7 +48,7 @@ class BackendMock:
     def set_task_status(self, task: Task, status: TaskState, pipe=None) -> None:
         log.debug("Setting task %s status to %s", task.uid, status)
 
-    def produce_unrouted_task(self, task: Task) -> None:
+    def produce_unrouted_task(self, task: Task, pipe=None) -> None:
         log.debug("Producing a new unrouted task")
         self.produced_tasks.append(task)
 
@@ -54,9 +62,14 @@ class BackendMock:
         # Return a truthy value to signal that the message has been consumed
         return True
 
-    def increment_metrics(self, metric: KartonMetrics, identity: str) -> None:
+    def increment_metrics(
+        self, metric: KartonMetrics, identity: str, pipe=None
+    ) -> None:
         log.debug("Incrementing metric %s for identity %s", metric, identity)
 
+    def make_pipeline(self, transaction: bool = False) -> PipelineMock:
+        return PipelineMock()
+
     def remove_object(self, bucket: str, object_uid: str) -> None:
         log.debug("Deleting object %s from bucket %s", object_uid, bucket)
         del self.buckets[bucket][object_uid]
@@ -255,7 +268,10 @@ class KartonTestCase(unittest.TestCase):
         outgoing_task = self._process_task(task)
         self.karton.current_task = outgoing_task
 
-        self.karton.process(self.karton.current_task)
+        if isinstance(self.karton, AsyncConsumer):
+            asyncio.run(self.karton.process_async(self.karton.current_task))
+        else:
+            self.karton.process(self.karton.current_task)
 
         return self.karton.backend.produced_tasks
 
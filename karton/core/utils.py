@@ -1,8 +1,12 @@
 import functools
 import itertools
+import json
+import math
 import signal
 from contextlib import contextmanager
-from typing import Any, Callable, Iterator, Sequence, Tuple, TypeVar
+from typing import Any, Callable, Dict, Iterator, Sequence, Tuple, TypeVar
+
+import orjson
 
 from .exceptions import HardShutdownInterrupt, TaskTimeoutError
 
@@ -23,6 +27,86 @@ def chunks_iter(seq: Iterator[T], size: int) -> Iterator[Sequence[T]]:
         yield elements
 
 
+# Types that are stored by orjson exactly the same way as by json module
+_ORJSON_TYPES = frozenset((str, int, float, bool, type(None)))
+
+
+def check_orjson_value(obj: Any) -> None:
+    """
+    Raises ValueError if orjson wouldn't store the scalar value
+    the same way as json module does (e.g. NaN, datetime or Enum objects)
+
+    :param obj: Scalar value
+    """
+    obj_type = type(obj)
+    if obj_type not in _ORJSON_TYPES:
+        raise ValueError(f"Object of type {obj_type.__name__} must be stored by json")
+    if obj_type is float and not math.isfinite(obj):
+        raise ValueError("Out of range float values are not JSON compliant")
+
+
+def check_orjson_keys(obj: Dict[Any, Any]) -> None:
+    """
+    Raises ValueError if dictionary has non-string keys, which orjson
+    doesn't store the same way as json module does
+
+    :param obj: Dictionary
+    """
+    if any(type(k) is not str for k in obj):
+        raise ValueError("Non-string keys must be stored by json")
+
+
+def json_dumps(obj: Any) -> str:
+    """
+    Serializes object to JSON using orjson, unless it contains values that orjson
+    wouldn't store the same way as json module does. Such objects are stored
+    by json module, so unsupported values are rejected as before.
+
+    :param obj: Object to serialize
+    :return: JSON data
+    """
+
+    def check(obj: Any) -> None:
+        if type(obj) is dict:
+            check_orjson_keys(obj)
+            for value in obj.values():
+                check(value)
+        elif type(obj) is list or type(obj) is tuple:
+            for value in obj:
+                check(value)
+        else:
+            check_orjson_value(obj)
+
+    try:
+        check(obj)
+        return orjson.dumps(obj).decode("utf8")
+    except (TypeError, ValueError):
+        # e.g. integers above 64-bit are not supported by orjson
+        return json.dumps(obj)
+
+
+def json_loads(data: str) -> Any:
+    """
+    Parses JSON data using orjson, unless data was written by built-in json module
+
+    Karton writes JSON using json module only for data that can't be stored
+    by orjson without loss, e.g. integers above 64-bit, which orjson would parse
+    as floats. Contrary to compact orjson output, json module puts a space
+    after the first key, so there is no need to scan the whole data.
+
+    :param data: JSON data
+    :return: Parsed object
+    """
+    first_key_end = data.find('":')
+    if data[first_key_end + 2 : first_key_end + 3] != " ":
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson doesn't support NaN and Infinity values
+            pass
+    return json.loads(data)
+
+
 def recursive_iter(obj: Any) -> Iterator[Any]:
     """
     Yields all values recursively from nested list/dict structures
@@ -1,7 +1,7 @@
 import argparse
 import json
 import time
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from karton.core.__version__ import __version__
 from karton.core.backend import (
@@ -12,7 +12,7 @@ from karton.core.backend import (
 )
 from karton.core.base import KartonServiceBase
 from karton.core.config import Config
-from karton.core.task import Task, TaskState
+from karton.core.task import CompiledFilters, Task, TaskState
 from karton.core.utils import StrictClassMethod
 
 
@@ -46,6 +46,8 @@ class SystemService(KartonServiceBase):
         self.enable_router = self.config.getboolean("system", "enable_router", True)
 
         self.last_gc_trigger = time.time()
+        # Filters of binds compiled for routing, by bind identity
+        self._compiled_filters: Dict[str, CompiledFilters] = {}
 
     def gc_collect_resources(self) -> None:
         # Collects unreferenced resources left in object storage
@@ -164,6 +166,14 @@ class SystemService(KartonServiceBase):
                 self.log.exception("GC: Exception during garbage collection")
             self.last_gc_trigger = time.time()
 
+    def get_compiled_filters(self, bind: KartonBind) -> CompiledFilters:
+        # Filters are compiled again only if bind has been changed
+        compiled_filters = self._compiled_filters.get(bind.identity)
+        if compiled_filters is None or compiled_filters.filters != bind.filters:
+            compiled_filters = CompiledFilters(bind.filters)
+            self._compiled_filters[bind.identity] = compiled_filters
+        return compiled_filters
+
     def route_task(self, task: Task, binds: List[KartonBind]) -> None:
         # Performs routing of task
         self.log.info("[%s] Processing task %s", task.root_uid, task.task_uid)
@@ -175,7 +185,7 @@ class SystemService(KartonServiceBase):
         pipe = self.backend.make_pipeline()
         for bind in binds:
             identity = bind.identity
-            if task.matches_filters(bind.filters):
+            if task.matches_filters(self.get_compiled_filters(bind)):
                 routed_task = task.fork_task()
                 routed_task.status = TaskState.SPAWNED
                 routed_task.last_update = time.time()
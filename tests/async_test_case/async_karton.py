@@ -0,0 +1,24 @@
+import asyncio
+
+from karton.core import AsyncKarton, Task
+
+
+class AsyncUppercaseKarton(AsyncKarton):
+    identity = "karton.async-uppercase"
+    filters = [
+        {
+            "type": "uppercase-task"
+        }
+    ]
+
+    async def process_async(self, task: Task) -> None:
+        await asyncio.sleep(0)
+        text = task.get_payload("text")
+        await self.send_task_async(Task(
+            headers={
+                "type": "uppercase-result"
+            },
+            payload={
+                "text": text.upper()
+            }
+        ))
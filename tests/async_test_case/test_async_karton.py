@@ -0,0 +1,29 @@
+from karton.core import Task
+from karton.core.test import KartonTestCase
+
+from .async_karton import AsyncUppercaseKarton
+
+
+class AsyncUppercaseKartonTestCase(KartonTestCase):
+    """
+    Test a karton that processes tasks in asyncio coroutine
+    """
+
+    karton_class = AsyncUppercaseKarton
+
+    def test_uppercase(self) -> None:
+        task = Task({
+            "type": "uppercase-task",
+        }, payload={
+            "text": "foobarbaz"
+        })
+
+        results = self.run_task(task)
+
+        expected_task = Task({
+            "origin": "karton.async-uppercase",
+            "type": "uppercase-result"
+        }, payload={
+            "text": "FOOBARBAZ",
+        })
+        self.assertTasksEqual(results, [expected_task])
@@ -0,0 +1,39 @@
+import unittest
+from unittest import mock
+
+from karton.core.backend import KartonBackend
+from karton.core.test import ConfigMock
+
+try:
+    import fakeredis
+
+    # Lua scripting support
+    import lupa  # noqa
+except ImportError:
+    fakeredis = None
+
+
+class FakeBackendTestCase(unittest.TestCase):
+    """
+    Test case with KartonBackend connected to the fake Redis server
+    """
+
+    def setUp(self) -> None:
+        if fakeredis is None:
+            self.skipTest("fakeredis with Lua support is not installed")
+        self.server = fakeredis.FakeServer()
+        self.config = ConfigMock()
+        self.config._config["s3"] = {
+            "address": "http://localhost:9000",
+            "access_key": "access_key",
+            "secret_key": "secret_key",
+        }
+        with mock.patch.object(KartonBackend, "make_redis", self.make_redis):
+            self.backend = KartonBackend(self.config)
+        self.backend.make_async_redis = self.make_async_redis
+
+    def make_redis(self, *args, **kwargs):
+        return fakeredis.FakeStrictRedis(server=self.server, decode_responses=True)
+
+    async def make_async_redis(self, *args, **kwargs):
+        return fakeredis.FakeAsyncRedis(server=self.server, decode_responses=True)
@@ -0,0 +1,204 @@
+import asyncio
+import threading
+import time
+import unittest
+from unittest import mock
+
+from karton.core import AsyncConsumer, Task
+from karton.core.exceptions import TaskTimeoutError
+from karton.core.task import TaskPriority, TaskState
+from karton.core.test import BackendMock, ConfigMock
+
+from .fake_backend import FakeBackendTestCase
+
+
+class SleepingAsyncConsumer(AsyncConsumer):
+    identity = "karton.async-test"
+    filters = [{"type": "sample"}]
+    concurrency = 2
+    sleep_time = 0.1
+    # Consumer shuts down after starting that number of tasks
+    max_tasks = 4
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.processed = []
+        self.active = 0
+        self.max_active = 0
+
+    async def process_async(self, task: Task) -> None:
+        assert self.current_task is task
+        self.processed.append(task.uid)
+        if len(self.processed) >= self.max_tasks:
+            self._shutdown = True
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        try:
+            await asyncio.sleep(self.sleep_time)
+        finally:
+            self.active -= 1
+
+
+class BlockingConsumer(AsyncConsumer):
+    identity = "karton.async-test"
+    filters = [{"type": "sample"}]
+    concurrency = 1
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.released = threading.Event()
+
+    def process(self, task: Task) -> None:
+        self._shutdown = True
+        self.released.wait(timeout=5)
+
+
+class TestAsyncConsumer(FakeBackendTestCase):
+    def make_consumer(self, **attributes) -> SleepingAsyncConsumer:
+        consumer = SleepingAsyncConsumer(config=self.config, backend=self.backend)
+        for name, value in attributes.items():
+            setattr(consumer, name, value)
+        self.backend.register_bind(consumer._bind)
+        return consumer
+
+    def produce_tasks(self, tasks, identity="karton.async-test"):
+        for task in tasks:
+            self.backend.register_task(task)
+            self.backend.produce_routed_task(identity, task)
+        return tasks
+
+    def get_status(self, task: Task) -> TaskState:
+        return self.backend.get_task(task.uid).status
+
+    def test_workers(self):
+        consumer = self.make_consumer()
+        rejected = self.produce_tasks([Task({"type": "other"})])
+        tasks = self.produce_tasks([Task({"type": "sample"}) for _ in range(4)])
+
+        consumer.loop()
+
+        self.assertEqual(sorted(consumer.processed), sorted(t.uid for t in tasks))
+        self.assertEqual(consumer.max_active, 2)
+        for task in tasks + rejected:
+            self.assertEqual(self.get_status(task), TaskState.FINISHED)
+
+    def test_restore_prefetched_tasks(self):
+        consumer = self.make_consumer(concurrency=1, prefetch_count=3, max_tasks=1)
+        tasks = self.produce_tasks([Task({"type": "sample"}) for _ in range(5)])
+
+        consumer.loop()
+
+        self.assertEqual(consumer.processed, [tasks[0].uid])
+        # Prefetched tasks are given back at the front of the queue
+        queue = self.backend.get_queue_name(consumer.identity, TaskPriority.NORMAL)
+        self.assertEqual(
+            self.backend.redis.lrange(queue, 0, -1), [t.uid for t in tasks[1:]]
+        )
+
+    def test_restore_tasks_after_error(self):
+        consumer = self.make_consumer(prefetch_count=3, max_tasks=6)
+        tasks = self.produce_tasks([Task({"type": "sample"}) for _ in range(6)])
+        report_task_result = consumer._report_task_result
+
+        def fail_first_task(task, *args):
+            if task.uid == tasks[0].uid:
+                raise RuntimeError("Redis error")
+            report_task_result(task, *args)
+
+        with mock.patch.object(
+            consumer, "_report_task_result", side_effect=fail_first_task
+        ):
+            with self.assertRaises(RuntimeError):
+                consumer.loop()
+
+        # Failed worker and the stopped one give back tasks they haven't started
+        queue = self.backend.get_queue_name(consumer.identity, TaskPriority.NORMAL)
+        queued = self.backend.redis.lrange(queue, 0, -1)
+        self.assertEqual(
+            [uid for uid in queued if uid in (tasks[1].uid, tasks[2].uid)],
+            [tasks[1].uid, tasks[2].uid],
+        )
+        self.assertEqual(
+            sorted(queued + consumer.processed), sorted(t.uid for t in tasks)
+        )
+
+    def test_task_timeout(self):
+        consumer = self.make_consumer(
+            concurrency=1, max_tasks=1, sleep_time=5, task_timeout=1
+        )
+        [task] = self.produce_tasks([Task({"type": "sample"})])
+
+        consumer.loop()
+
+        self.assertEqual(self.get_status(task), TaskState.CRASHED)
+        self.assertIn("TaskTimeoutError", self.backend.get_task(task.uid).error[-1])
+
+    def test_sync_task_timeout(self):
+        consumer = BlockingConsumer(config=self.config, backend=self.backend)
+        consumer.task_timeout = 1
+        self.backend.register_bind(consumer._bind)
+        [task] = self.produce_tasks([Task({"type": "sample"})])
+
+        # Post-hook is not blocked by the thread running timed out process()
+        hook_exceptions = []
+
+        def post_hook(task, exception):
+            hook_exceptions.append(exception)
+            consumer.released.set()
+
+        consumer.add_post_hook(post_hook)
+        start = time.monotonic()
+        consumer.loop()
+
+        self.assertLess(time.monotonic() - start, 4)
+        self.assertIsInstance(hook_exceptions[0], TaskTimeoutError)
+        self.assertEqual(self.get_status(task), TaskState.CRASHED)
+
+    def test_consume_routed_tasks_async(self):
+        consumer = self.make_consumer()
+        tasks = self.produce_tasks(
+            [
+                Task({"type": "sample"}, priority=priority)
+                for priority in (TaskPriority.LOW, TaskPriority.HIGH)
+            ]
+        )
+
+        async def consume():
+            redis = await self.backend.make_async_redis(self.config)
+            bind, consumed = await self.backend.consume_routed_tasks_async(
+                redis, consumer.identity, max_count=10, parse_resources=False
+            )
+            self.assertEqual(bind, consumer._bind)
+            # Tasks are consumed from the most prioritized queue
+            self.assertEqual([t.uid for t in consumed], [tasks[1].uid, tasks[0].uid])
+
+            # Queues are empty, so consumer waits for a new task
+            async def produce_later():
+                await asyncio.sleep(0.1)
+                self.produce_tasks([Task({"type": "sample"})])
+
+            producer = asyncio.ensure_future(produce_later())
+            bind, consumed = await self.backend.consume_routed_tasks_async(
+                redis, consumer.identity, max_count=10, timeout=2
+            )
+            await producer
+            self.assertEqual(len(consumed), 1)
+
+        asyncio.run(consume())
+
+
+class TestAsyncConsumerMethods(unittest.TestCase):
+    def test_missing_process_methods(self):
+        class EmptyConsumer(AsyncConsumer):
+            identity = "karton.async-empty"
+            filters = [{"type": "sample"}]
+
+        with self.assertRaises(TypeError):
+            EmptyConsumer(config=ConfigMock(), backend=BackendMock())
+
+    def test_process_runs_process_async(self):
+        consumer = SleepingAsyncConsumer(config=ConfigMock(), backend=BackendMock())
+        task = Task({"type": "sample"})
+        consumer.current_task = task
+        consumer.process(task)
+        self.assertEqual(consumer.processed, [task.uid])
@@ -0,0 +1,95 @@
+import threading
+
+from karton.core import Task
+from karton.core.backend import KartonBind
+from karton.core.task import TaskPriority
+
+from .fake_backend import FakeBackendTestCase
+
+IDENTITY = "karton.backend-test"
+
+
+class TestConsumeRoutedTasks(FakeBackendTestCase):
+    def setUp(self) -> None:
+        super().setUp()
+        self.bind = KartonBind(
+            identity=IDENTITY,
+            info=None,
+            version="5.0.0",
+            persistent=True,
+            filters=[{"type": "sample"}],
+            service_version=None,
+        )
+        self.backend.register_bind(self.bind)
+
+    def produce_task(self, priority=TaskPriority.NORMAL, register=True) -> Task:
+        task = Task({"type": "sample"}, priority=priority)
+        if register:
+            self.backend.register_task(task)
+        self.backend.produce_routed_task(IDENTITY, task)
+        return task
+
+    def get_queue(self, priority=TaskPriority.NORMAL):
+        queue = self.backend.get_queue_name(IDENTITY, priority)
+        return self.backend.redis.lrange(queue, 0, -1)
+
+    def test_priority_order(self):
+        low = self.produce_task(TaskPriority.LOW)
+        normal = self.produce_task(TaskPriority.NORMAL)
+        high = self.produce_task(TaskPriority.HIGH)
+        # Legacy queue of Karton 2.x.x goes first
+        legacy = Task({"type": "sample"})
+        self.backend.register_task(legacy)
+        self.backend.redis.rpush(IDENTITY, legacy.uid)
+
+        bind, tasks = self.backend.consume_routed_tasks(IDENTITY, max_count=10)
+        self.assertEqual(bind, self.bind)
+        self.assertEqual(
+            [task.uid for task in tasks], [legacy.uid, high.uid, normal.uid, low.uid]
+        )
+
+    def test_max_count(self):
+        tasks = [self.produce_task() for _ in range(3)]
+
+        _, consumed = self.backend.consume_routed_tasks(IDENTITY, max_count=2)
+        self.assertEqual([task.uid for task in consumed], [t.uid for t in tasks[:2]])
+        self.assertEqual(self.get_queue(), [tasks[2].uid])
+
+    def test_missing_task_bodies(self):
+        first = self.produce_task()
+        self.produce_task(register=False)
+        last = self.produce_task()
+
+        _, consumed = self.backend.consume_routed_tasks(IDENTITY, max_count=3)
+        self.assertEqual([task.uid for task in consumed], [first.uid, last.uid])
+
+    def test_restore_routed_tasks(self):
+        tasks = [self.produce_task(), self.produce_task(TaskPriority.HIGH)]
+        tasks += [self.produce_task() for _ in range(2)]
+
+        _, consumed = self.backend.consume_routed_tasks(IDENTITY, max_count=3)
+        self.backend.restore_routed_tasks(IDENTITY, consumed[1:])
+        self.assertEqual(self.get_queue(TaskPriority.HIGH), [])
+        self.assertEqual(
+            self.get_queue(), [consumed[1].uid, consumed[2].uid, tasks[3].uid]
+        )
+
+    def test_wait_for_task(self):
+        bind, tasks = self.backend.consume_routed_tasks(IDENTITY, timeout=1)
+        self.assertEqual(bind, self.bind)
+        self.assertEqual(tasks, [])
+
+        # Queues are empty, so consumer waits for a new task
+        producer = threading.Timer(0.1, self.produce_task)
+        producer.start()
+        _, tasks = self.backend.consume_routed_tasks(IDENTITY, timeout=2)
+        producer.join()
+        self.assertEqual(len(tasks), 1)
+
+    def test_unregistered_bind(self):
+        self.backend.unregister_bind(IDENTITY)
+        task = self.produce_task()
+
+        bind, tasks = self.backend.consume_routed_tasks(IDENTITY)
+        self.assertIsNone(bind)
+        self.assertEqual([t.uid for t in tasks], [task.uid])
@@ -0,0 +1,139 @@
+import unittest
+from unittest import mock
+
+from karton.core import Consumer, Task
+from karton.core.task import TaskPriority
+from karton.core.test import ConfigMock
+
+from .fake_backend import FakeBackendTestCase
+
+
+class DummyConsumer(Consumer):
+    identity = "karton.dummy"
+    filters = [{"type": "test"}]
+
+    def process(self, task: Task) -> None:
+        pass
+
+
+class TestConsumerLoop(unittest.TestCase):
+    def make_consumer(self, concurrency: int) -> Consumer:
+        backend = mock.MagicMock()
+        consumer = DummyConsumer(config=ConfigMock(), backend=backend)
+        consumer.concurrency = concurrency
+        backend.consume_routed_tasks.return_value = (
+            consumer._bind,
+            [Task({"type": "test"})],
+        )
+        # Final task status update fails outside of process() error handling
+        backend.make_pipeline.return_value.execute.side_effect = RuntimeError
+        return consumer
+
+    def test_unexpected_error(self):
+        consumer = self.make_consumer(concurrency=1)
+        with self.assertRaises(RuntimeError):
+            consumer.loop()
+
+    def test_unexpected_error_in_worker_thread(self):
+        consumer = self.make_consumer(concurrency=4)
+        with self.assertRaises(RuntimeError):
+            consumer.loop()
+        self.assertTrue(consumer.shutdown)
+
+
+class TestConsumerHooks(unittest.TestCase):
+    def setUp(self):
+        self.consumer = DummyConsumer(config=ConfigMock(), backend=mock.MagicMock())
+        self.task = Task({"type": "test"})
+        self.consumer.current_task = self.task
+        self.calls = []
+
+    def add_hooks(self, failing):
+        for idx in range(5):
+            def hook(task, idx=idx):
+                self.calls.append((idx, task))
+                if idx in failing:
+                    raise RuntimeError(idx)
+
+            # Hooks with odd numbers are not named
+            name = f"hook{idx}" if idx % 2 == 0 else None
+            self.consumer.add_pre_hook(hook, name)
+
+    def run_hooks(self):
+        with self.assertLogs(self.consumer.log, "ERROR") as logs:
+            self.consumer._run_pre_hooks()
+        return [record.getMessage() for record in logs.records]
+
+    def test_failing_hooks(self):
+        self.add_hooks(failing={0, 1, 4})
+
+        messages = self.run_hooks()
+        self.assertEqual(self.calls, [(idx, self.task) for idx in range(5)])
+        self.assertEqual(
+            messages,
+            ["Pre-hook (hook0) failed", "Pre-hook failed", "Pre-hook (hook4) failed"],
+        )
+
+    def test_failing_parallel_hooks(self):
+        self.consumer.parallel_hooks = True
+        self.add_hooks(failing={0, 1, 4})
+
+        messages = self.run_hooks()
+        self.consumer._hook_executor.shutdown(wait=True)
+        self.assertEqual(sorted(self.calls), [(idx, self.task) for idx in range(5)])
+        self.assertEqual(
+            messages,
+            ["Pre-hook (hook0) failed", "Pre-hook failed", "Pre-hook (hook4) failed"],
+        )
+        self.assertIs(self.consumer.current_task, self.task)
+
+    def test_parallel_hooks_after_loop(self):
+        self.consumer.parallel_hooks = True
+        self.add_hooks(failing=set())
+        self.consumer.backend.consume_routed_tasks.return_value = (
+            self.consumer._bind,
+            [self.task],
+        )
+
+        def process(task):
+            self.consumer._shutdown = True
+
+        with mock.patch.object(self.consumer, "process", side_effect=process):
+            self.consumer.loop()
+        self.assertIsNone(self.consumer._hook_executor)
+
+        # Hooks run after the loop don't use the executor shut down by it
+        self.consumer.current_task = self.task
+        self.consumer._run_pre_hooks()
+        self.consumer._hook_executor.shutdown(wait=True)
+        self.assertEqual(
+            sorted(self.calls), sorted([(idx, self.task) for idx in range(5)] * 2)
+        )
+
+
+class InterruptedConsumer(Consumer):
+    identity = "karton.interrupted"
+    filters = [{"type": "test"}]
+    prefetch_count = 5
+
+    def process(self, task: Task) -> None:
+        raise KeyboardInterrupt
+
+
+class TestConsumerPrefetch(FakeBackendTestCase):
+    def test_restore_tasks_after_interrupt(self):
+        consumer = InterruptedConsumer(config=self.config, backend=self.backend)
+        self.backend.register_bind(consumer._bind)
+        tasks = [Task({"type": "test"}) for _ in range(5)]
+        for task in tasks:
+            self.backend.register_task(task)
+            self.backend.produce_routed_task(consumer.identity, task)
+
+        with self.assertRaises(KeyboardInterrupt):
+            consumer.loop()
+
+        # Only the interrupted task is lost
+        queue = self.backend.get_queue_name(consumer.identity, TaskPriority.NORMAL)
+        self.assertEqual(
+            self.backend.redis.lrange(queue, 0, -1), [t.uid for t in tasks[1:]]
+        )
@@ -1,7 +1,16 @@
+import dataclasses
+import datetime
+import json
 import os
 import unittest
+import uuid
 from unittest.mock import patch, mock_open
-from karton.core import Config, Task
+
+import orjson
+
+from karton.core import Config, RemoteResource, Task
+from karton.core.task import TaskPriority
+from karton.core.utils import json_dumps, json_loads
 
 MOCK_CONFIG = """
 [s3]
@@ -55,3 +64,85 @@ class TestTask(unittest.TestCase):
         self.assertTrue(task.matches_filters([{"A": "a", "B": "b"}]))
         self.assertFalse(task.matches_filters([{"Z": "a"}]))
         self.assertFalse(task.matches_filters([{"A": "a", "Z": "a"}]))
+
+    def test_serialization_roundtrip(self):
+        resource = RemoteResource("sample", bucket="karton", uid="1234", size=5)
+        task = Task(
+            headers={"type": "sample"},
+            payload={"sample": resource, "nested": {"list": [resource, 1, "two"]}},
+            payload_persistent={"big": 2 ** 70 + 1},
+        )
+        task_data = Task.unserialize(task.serialize())
+        self.assertEqual(task_data.uid, task.uid)
+        self.assertEqual(task_data.headers, task.headers)
+        self.assertIsInstance(task_data.get_payload("sample"), RemoteResource)
+        self.assertEqual(task_data.get_payload("sample").uid, "1234")
+        nested = task_data.get_payload("nested")["list"]
+        self.assertIsInstance(nested[0], RemoteResource)
+        self.assertEqual(nested[1:], [1, "two"])
+        self.assertEqual(task_data.get_payload("big"), 2 ** 70 + 1)
+
+        raw_task_data = Task.unserialize(task.serialize(), parse_resources=False)
+        self.assertEqual(
+            raw_task_data.get_payload("sample"),
+            {"__karton_resource__": resource.to_dict()},
+        )
+        raw_task_data.unserialize_resources(None)
+        self.assertIsInstance(raw_task_data.get_payload("sample"), RemoteResource)
+        self.assertEqual(raw_task_data.get_payload("sample").uid, "1234")
+        self.assertEqual(raw_task_data.get_payload("big"), 2 ** 70 + 1)
+
+    def test_serialization_non_finite_floats(self):
+        task = Task(
+            headers={"type": "sample"},
+            payload={"values": [float("nan"), float("inf")], "ratio": 0.5},
+        )
+        task_data = Task.unserialize(task.serialize())
+        nan, inf = task_data.get_payload("values")
+        self.assertNotEqual(nan, nan)
+        self.assertEqual(inf, float("inf"))
+        self.assertEqual(task_data.get_payload("ratio"), 0.5)
+
+    def test_serialization_unsupported_values(self):
+        @dataclasses.dataclass
+        class Point:
+            x: int
+
+        unsupported_values = [
+            datetime.datetime(2020, 1, 1),
+            uuid.uuid4(),
+            TaskPriority.HIGH,
+            Point(1),
+            {datetime.date(2020, 1, 1): "date key"},
+        ]
+        for value in unsupported_values:
+            task = Task(headers={"type": "sample"}, payload={"value": value})
+            with self.assertRaises(TypeError):
+                task.serialize()
+            # Regardless of other values that make Task to be stored by json module
+            task.add_payload("big", 2 ** 70)
+            with self.assertRaises(TypeError):
+                task.serialize()
+
+        task = Task(headers={"type": "sample", "date": datetime.date(2020, 1, 1)})
+        with self.assertRaises(TypeError):
+            task.serialize()
+
+
+class TestJson(unittest.TestCase):
+    def test_orjson_roundtrip(self):
+        log_record = {"message": "Task done", "levelno": 20, "task": {"uid": "1"}}
+        data = json_dumps(log_record)
+        self.assertEqual(data, orjson.dumps(log_record).decode())
+        # Data written by orjson is parsed only by orjson
+        with patch("karton.core.utils.json.loads", side_effect=AssertionError):
+            self.assertEqual(json_loads(data), log_record)
+
+    def test_json_fallback(self):
+        for log_record in [{"value": 2 ** 70}, {"value": float("inf")}, {1: "key"}]:
+            data = json_dumps(log_record)
+            self.assertEqual(data, json.dumps(log_record))
+            self.assertEqual(json_loads(data), json.loads(data))
+
+        with self.assertRaises(TypeError):
+            json_dumps({"value": datetime.datetime(2020, 1, 1)})
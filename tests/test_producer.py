@@ -0,0 +1,53 @@
+import unittest
+from unittest import mock
+
+from karton.core import Producer, Resource, Task
+from karton.core.task import TaskPriority
+from karton.core.test import BackendMock, ConfigMock
+
+
+class TestProducer(unittest.TestCase):
+    def setUp(self):
+        self.backend = BackendMock()
+        self.producer = Producer(
+            config=ConfigMock(), identity="karton.producer-test", backend=self.backend
+        )
+
+    def test_send_tasks(self):
+        parent = Task(
+            {"type": "parent"},
+            payload_persistent={"persistent": "value"},
+            priority=TaskPriority.HIGH,
+        )
+        self.producer.current_task = parent
+
+        shared = Resource("shared.txt", b"shared")
+        tasks = [
+            Task({"type": "child"}, payload={"shared": shared}),
+            Task({"type": "child"}, payload={"nested": {"shared": shared}}),
+            Task({"type": "child"}, payload={"own": Resource("own.txt", b"own")}),
+        ]
+
+        with mock.patch.object(
+            self.backend, "upload_object", wraps=self.backend.upload_object
+        ) as upload_object:
+            self.assertTrue(self.producer.send_tasks(tasks))
+
+        self.assertEqual(self.backend.produced_tasks, tasks)
+        for task in tasks:
+            self.assertEqual(task.headers["origin"], "karton.producer-test")
+            self.assertEqual(task.parent_uid, parent.uid)
+            self.assertEqual(task.root_uid, parent.root_uid)
+            self.assertEqual(task.priority, TaskPriority.HIGH)
+            self.assertEqual(task.get_payload("persistent"), "value")
+
+        # Shared resource is uploaded only once
+        self.assertEqual(upload_object.call_count, 2)
+        self.assertEqual(
+            self.backend.buckets[self.backend.default_bucket_name],
+            {shared.uid: b"shared", tasks[2].get_resource("own").uid: b"own"},
+        )
+
+    def test_send_no_tasks(self):
+        self.assertTrue(self.producer.send_tasks([]))
+        self.assertEqual(self.backend.produced_tasks, [])
@@ -1,4 +1,5 @@
 from karton.core import Task
+from karton.core.task import CompiledFilters
 import unittest
 
 
@@ -261,3 +262,52 @@ class TestTaskFilters(unittest.TestCase):
             "platform": "win64"
         })
         self.assertFalse(task_sample_win64.matches_filters(filters))
+
+    def test_compiled_filters_with_type_patterns(self):
+        filters = CompiledFilters([
+            {
+                "type": "sample",
+                "kind": "raw"
+            },
+            {
+                "type": "conf*",
+            },
+            {
+                "type": "!sample",
+                "platform": "win32"
+            },
+            {
+                "type": 1337,
+            }
+        ])
+
+        task_sample_raw = Task(headers={"type": "sample", "kind": "raw"})
+        self.assertTrue(task_sample_raw.matches_filters(filters))
+
+        task_sample_exe = Task(headers={"type": "sample", "kind": "exe"})
+        self.assertFalse(task_sample_exe.matches_filters(filters))
+
+        task_config = Task(headers={"type": "config"})
+        self.assertTrue(task_config.matches_filters(filters))
+
+        task_blob_win32 = Task(headers={"type": "blob", "platform": "win32"})
+        self.assertTrue(task_blob_win32.matches_filters(filters))
+
+        task_sample_win32 = Task(headers={"type": "sample", "platform": "win32"})
+        self.assertFalse(task_sample_win32.matches_filters(filters))
+
+        task_without_type = Task(headers={"platform": "win32"})
+        self.assertTrue(task_without_type.matches_filters(filters))
+
+        task_number = Task(headers={"type": 1337})
+        self.assertTrue(task_number.matches_filters(filters))
+
+    def test_equal_filter_values_of_different_types(self):
+        # True == 1, but filter values are matched as strings
+        task_true = Task(headers={"flag": True})
+        self.assertTrue(task_true.matches_filters([{"flag": True}]))
+        self.assertFalse(task_true.matches_filters([{"flag": 1}]))
+
+        task_one = Task(headers={"flag": 1})
+        self.assertTrue(task_one.matches_filters([{"flag": 1}]))
+        self.assertFalse(task_one.matches_filters([{"flag": True}]))
@@ -0,0 +1,50 @@
+import threading
+
+from karton.core import Task
+from karton.core.test import KartonTestCase
+
+from .thread_karton import ThreadedForwarderKarton
+
+
+class ThreadedForwarderKartonTestCase(KartonTestCase):
+    """
+    Test a karton that sends tasks from a thread started by process()
+    """
+
+    karton_class = ThreadedForwarderKarton
+
+    def test_forward(self) -> None:
+        task = Task({
+            "type": "forward-task",
+        }, payload={
+            "text": "foobarbaz"
+        }, payload_persistent={
+            "persistent": "value"
+        })
+
+        results = self.run_task(task)
+
+        expected_task = Task({
+            "origin": "karton.threaded-forwarder",
+            "type": "forward-result"
+        }, payload={
+            "text": "foobarbaz",
+        }, payload_persistent={
+            "persistent": "value"
+        })
+        self.assertTasksEqual(results, [expected_task])
+        # Child task is derived from the current task
+        self.assertEqual(results[0].parent_uid, self.karton.current_task.uid)
+        self.assertEqual(results[0].root_uid, self.karton.current_task.root_uid)
+
+    def test_log_handler_task(self) -> None:
+        task = Task({"type": "forward-task"})
+        self.karton.log_handler.task = task
+
+        log_tasks = []
+        thread = threading.Thread(
+            target=lambda: log_tasks.append(self.karton.log_handler.task)
+        )
+        thread.start()
+        thread.join()
+        self.assertEqual(log_tasks, [task])
@@ -0,0 +1,28 @@
+import threading
+
+from karton.core import Karton, Task
+
+
+class ThreadedForwarderKarton(Karton):
+    identity = "karton.threaded-forwarder"
+    filters = [
+        {
+            "type": "forward-task"
+        }
+    ]
+
+    def forward(self, task: Task) -> None:
+        self.log.info("Forwarding task")
+        self.send_task(Task(
+            headers={
+                "type": "forward-result"
+            },
+            payload={
+                "text": task.get_payload("text")
+            }
+        ))
+
+    def process(self, task: Task) -> None:
+        thread = threading.Thread(target=self.forward, args=(task,))
+        thread.start()
+        thread.join()